@@ -18,6 +18,8 @@ along with this program; if not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import functools
+
 import sigrokdecode as srd
 import common.srdhelper as hlp
 
@@ -80,6 +82,12 @@ class Params:
     (CUSTOM, POWERUP) = (0, 0x60a0)
 
 
+class State:
+    """Enumeration of decoder states."""
+
+    (IDLE, ADDRESS_SLAVE, REGISTER_ADDRESS, REGISTER_DATA) = range(4)
+
+
 ###############################################################################
 # Enumeration classes for annotations
 ###############################################################################
@@ -126,38 +134,103 @@ addr_annots = {  # Convert value to annotation index
     Address.SCL: AnnAddrs.SCL,
 }
 
+slave_addrs = frozenset((  # Valid slave addresses
+    Address.GND,
+    Address.VCC,
+    Address.SDA,
+    Address.SCL,
+))
+
 reg_annots_gc = {  # Convert general call register value to annotation index
     GeneralCall.RESET: AnnRegs.RESET,
 }
 
-reg_annots = {  # Convert device register value to annotation index
-    Register.CONF: AnnRegs.CONF,
-    Register.TEMP: AnnRegs.TEMP,
-    Register.TLOW: AnnRegs.TLOW,
-    Register.THIGH: AnnRegs.THIGH,
+reg_annots = (  # Convert device register value to annotation index
+    AnnRegs.TEMP,   # Register.TEMP
+    AnnRegs.CONF,   # Register.CONF
+    AnnRegs.TLOW,   # Register.TLOW
+    AnnRegs.THIGH,  # Register.THIGH
+)
+
+prm_annots = (  # Convert flag about power-up parameter to annotation index
+    AnnInfo.CUSTOM,  # Params.CUSTOM
+    AnnInfo.PWRUP,   # Params.POWERUP
+)
+
+em_mask = 1 << TempBits.EM  # Extended mode flag in temperature registers
+
+temp_modes = (  # Shift and sign bit of temperature value by extended mode
+    (4, 0x0800),  # Normal mode (12-bit resolution)
+    (3, 0x1000),  # Extended mode (13-bit resolution)
+)
+
+rates = (  # Convert conversion rate bits value to frequency
+    "0.25",  # 0b00
+    "1",     # 0b01
+    "4",     # 0b10
+    "8",     # 0b11
+)
+
+faults = (  # Convert fault queue bits value to number of faults
+    "1",  # 0b00
+    "2",  # 0b01
+    "4",  # 0b10
+    "6",  # 0b11
+)
+
+resolutions = (  # Convert converter resolution bits value to bits count
+    None, None, None,  # Not supported, bits are read only
+    "12",  # 0b11
+)
+
+enables = (  # Convert bit value to value, label, and abbreviation
+    (0, "disabled", "D"),
+    (1, "enabled", "E"),
+)
+
+polarities = (
+    (0, "low", "L"),
+    (1, "high", "H"),
+)
+
+thermostats = (
+    (0, "comparator", "C"),
+    (1, "interrupt", "I"),
+)
+
+alerts = (  # Convert alert and polarity bit values to alert value labels
+    ((0, "active", "A"), (0, "inactive", "I")),
+    ((1, "inactive", "I"), (1, "active", "A")),
+)
+
+config_fields = (  # Annotation, lowest and highest bit, value labels, and unit
+    (AnnBits.OS, ConfigBits.OS, ConfigBits.OS, enables, None),
+    (AnnBits.R0, ConfigBits.R0, ConfigBits.R1, resolutions, "bit"),
+    (AnnBits.F0, ConfigBits.F0, ConfigBits.F1, faults, None),
+    (AnnBits.POL, ConfigBits.POL, ConfigBits.POL, polarities, None),
+    (AnnBits.TM, ConfigBits.TM, ConfigBits.TM, thermostats, None),
+    (AnnBits.SD, ConfigBits.SD, ConfigBits.SD, enables, None),
+    (AnnBits.CR0, ConfigBits.CR0, ConfigBits.CR1, rates, "Hz"),
+    (AnnBits.AL, ConfigBits.AL, ConfigBits.AL, None, None),  # By polarity
+    (AnnBits.EM, ConfigBits.EM, ConfigBits.EM, None, None),  # Decoder state
+)
+
+config_masks = tuple(  # Lowest bit and mask of fields
+    (lsb, (1 << (msb - lsb + 1)) - 1) for _, lsb, msb, _, _ in config_fields
+)
+
+config_index = {  # Convert field annotation to its position in config_fields
+    field[0]: idx for idx, field in enumerate(config_fields)
 }
 
-prm_annots = {  # Convert device parameter value to annotation index
-    Params.CUSTOM: AnnInfo.CUSTOM,
-    Params.POWERUP: AnnInfo.PWRUP,
-}
+addr_cmds = frozenset(("ADDRESS WRITE", "ADDRESS READ"))  # Slave address
+data_cmds = frozenset(("DATA WRITE", "DATA READ"))  # Register address or data
+end_cmds = frozenset(("STOP", "START REPEAT"))  # End of transmission
 
-rates = {
-    0b00: "0.25",
-    0b01: "1",
-    0b10: "4",
-    0b11: "8",
-}
-
-faults = {
-    0b00: "1",
-    0b01: "2",
-    0b10: "4",
-    0b11: "6",
-}
-
-resolutions = {
-    0b11: "12",
+temp_scales = {  # Convert sensor units of 1/16 °C to temperature scale option
+    "Celsius": lambda rawdata: rawdata / 16,
+    "Fahrenheit": lambda rawdata: rawdata / 16 * 1.8 + 32,
+    "Kelvin": lambda rawdata: rawdata / 16 + 273.15,
 }
 
 temp_units = {  # Convert temperature scale option to measurement unit
@@ -171,54 +244,146 @@ temp_units = {  # Convert temperature scale option to measurement unit
 # Parameters anotations definitions
 ###############################################################################
 addresses = {
-    AnnAddrs.GC: ["General call", "GEN_CALL", "GC", "G"],
-    AnnAddrs.GND: ["ADD0 grounded", "ADD0_GND", "AG"],
-    AnnAddrs.VCC: ["ADD0 powered", "ADD0_VCC", "AV"],
-    AnnAddrs.SDA: ["ADD0 to SDA", "ADD0_SDA", "AD"],
-    AnnAddrs.SCL: ["ADD0 to SCL", "ADD0_SSCL", "AC"],
+    AnnAddrs.GC: ("General call", "GEN_CALL", "GC", "G"),
+    AnnAddrs.GND: ("ADD0 grounded", "ADD0_GND", "AG"),
+    AnnAddrs.VCC: ("ADD0 powered", "ADD0_VCC", "AV"),
+    AnnAddrs.SDA: ("ADD0 to SDA", "ADD0_SDA", "AD"),
+    AnnAddrs.SCL: ("ADD0 to SCL", "ADD0_SSCL", "AC"),
 }
 
 registers = {
-    AnnRegs.RESET: ["Reset register", "Reset", "Rst", "R"],
-    AnnRegs.CONF: ["Configuration register", "Configuration", "Conf",
-                   "Cfg", "C"],
-    AnnRegs.TEMP: ["Temperature register", "Temperature", "Temp", "T"],
-    AnnRegs.TLOW: ["Low alert register", "Low alert", "Tlow", "L"],
-    AnnRegs.THIGH: ["High alert register", "High alert", "Thigh", "H"],
+    AnnRegs.RESET: ("Reset register", "Reset", "Rst", "R"),
+    AnnRegs.CONF: ("Configuration register", "Configuration", "Conf",
+                   "Cfg", "C"),
+    AnnRegs.TEMP: ("Temperature register", "Temperature", "Temp", "T"),
+    AnnRegs.TLOW: ("Low alert register", "Low alert", "Tlow", "L"),
+    AnnRegs.THIGH: ("High alert register", "High alert", "Thigh", "H"),
 }
 
 bits = {
-    AnnBits.RESERVED: ["Reserved", "Rsvd", "R"],
-    AnnBits.DATA: ["Data", "D"],
-    AnnBits.EM: ["Extended mode", "EM", "E"],
-    AnnBits.AL: ["Alert", "AL", "A"],
-    AnnBits.CR0: ["Conversion rate", "Rate", "R"],
-    AnnBits.SD: ["Shutdown mode", "Shutdown", "Shtd", "SD", "S"],
-    AnnBits.TM: ["Thermostat mode", "Thermostat", "TMode", "TM", "T"],
-    AnnBits.POL: ["Polarity", "Pol", "P"],
-    AnnBits.F0: ["Consecutive faults", "Faults", "Flts", "F"],
-    AnnBits.R0: ["Converter resolution", "Resolution", "Res", "R"],
-    AnnBits.OS: ["One-shot conversion", "Oneshot", "OS", "O"],
+    AnnBits.RESERVED: ("Reserved", "Rsvd", "R"),
+    AnnBits.DATA: ("Data", "D"),
+    AnnBits.EM: ("Extended mode", "EM", "E"),
+    AnnBits.AL: ("Alert", "AL", "A"),
+    AnnBits.CR0: ("Conversion rate", "Rate", "R"),
+    AnnBits.SD: ("Shutdown mode", "Shutdown", "Shtd", "SD", "S"),
+    AnnBits.TM: ("Thermostat mode", "Thermostat", "TMode", "TM", "T"),
+    AnnBits.POL: ("Polarity", "Pol", "P"),
+    AnnBits.F0: ("Consecutive faults", "Faults", "Flts", "F"),
+    AnnBits.R0: ("Converter resolution", "Resolution", "Res", "R"),
+    AnnBits.OS: ("One-shot conversion", "Oneshot", "OS", "O"),
 }
 
 info = {
-    AnnInfo.WARN: ["Warnings", "Warn", "W"],
-    AnnInfo.BADADD: ["Uknown slave address", "Unknown address", "Uknown",
-                     "Unk", "U"],
-    AnnInfo.GRST: ["General reset", "GenReset", "GRST", "Rst", "R"],
-    AnnInfo.CHECK: ["Slave presence check", "Slave check", "Check",
-                    "Chk", "C"],
-    AnnInfo.WRITE: ["Write", "Wr", "W"],
-    AnnInfo.READ: ["Read", "Rd", "R"],
-    AnnInfo.SELECT: ["Select", "Sel", "S"],
-    AnnInfo.CUSTOM: ["Custom", "Cst", "C"],
-    AnnInfo.PWRUP: ["Power-up reset", "PwrReset", "Pwr", "P"],
-    AnnInfo.CONF: ["Configuration", "Conf", "Cfg", "C"],
-    AnnInfo.TEMP: ["Measured temperature", "Temperature", "Temp", "T"],
-    AnnInfo.TLOW: ["Low temperature limit", "Low limit", "Low", "L"],
-    AnnInfo.THIGH: ["High temperature limit", "High limit", "High", "H"],
+    AnnInfo.WARN: ("Warnings", "Warn", "W"),
+    AnnInfo.BADADD: ("Uknown slave address", "Unknown address", "Uknown",
+                     "Unk", "U"),
+    AnnInfo.GRST: ("General reset", "GenReset", "GRST", "Rst", "R"),
+    AnnInfo.CHECK: ("Slave presence check", "Slave check", "Check",
+                    "Chk", "C"),
+    AnnInfo.WRITE: ("Write", "Wr", "W"),
+    AnnInfo.READ: ("Read", "Rd", "R"),
+    AnnInfo.SELECT: ("Select", "Sel", "S"),
+    AnnInfo.CUSTOM: ("Custom", "Cst", "C"),
+    AnnInfo.PWRUP: ("Power-up reset", "PwrReset", "Pwr", "P"),
+    AnnInfo.CONF: ("Configuration", "Conf", "Cfg", "C"),
+    AnnInfo.TEMP: ("Measured temperature", "Temperature", "Temp", "T"),
+    AnnInfo.TLOW: ("Low temperature limit", "Low limit", "Low", "L"),
+    AnnInfo.THIGH: ("High temperature limit", "High limit", "High", "H"),
 }
 
+rw_actions = (info[AnnInfo.READ], info[AnnInfo.WRITE])  # Labels by write flag
+
+
+###############################################################################
+# Annotation helpers
+###############################################################################
+@functools.lru_cache(maxsize=256)
+def compose_annot(ann_label, ann_value=None, ann_unit=None, ann_action=None):
+    """Compose list of annotations with memoization of the result.
+
+    - Arguments are the same as for ``hlp.compose_annot``, but they have to be
+      hashable, so that sequences are passed as tuples. They are converted to
+      lists just for composing a result missing in the cache.
+    - The returned list is shared among calls with equal arguments, so that it
+      must not be modified by the caller.
+    - Annotations with widely varying values should be composed by the
+      uncached function ``compose_annot.__wrapped__`` or cached separately in
+      order not to evict recurring annotations from the cache.
+    """
+    return hlp.compose_annot(*[
+        list(arg) if isinstance(arg, tuple) else arg
+        for arg in (ann_label, ann_value, ann_unit, ann_action)
+    ])
+
+
+@functools.lru_cache(maxsize=1024)
+def temp_annot(temp, unit):
+    """Compose annotations of a measured temperature.
+
+    - Measured temperatures are cached separately from other annotations,
+      because they are too diverse and would evict recurring annotations
+      from the cache of ``compose_annot``.
+    """
+    return compose_annot.__wrapped__(info[AnnInfo.TEMP], ann_value=temp,
+                                     ann_unit=unit)
+
+
+@functools.lru_cache(maxsize=1024)
+def tempreg_annot(dataword, radix):
+    """Compose annotations of a temperature register value.
+
+    - Raw temperature words are cached separately for the same reason as
+      measured temperatures in ``temp_annot``.
+    """
+    val = hlp.format_data(dataword, radix)
+    return compose_annot.__wrapped__(registers[AnnRegs.TEMP], ann_value=val)
+
+
+@functools.lru_cache(maxsize=1024)
+def format_data(data, radix):
+    """Format data value in the radix with memoization of the result."""
+    return hlp.format_data(data, radix)
+
+
+static_data = {  # Annotation data without value composed at import
+    ann: [ann, hlp.compose_annot(list(labels))]
+    for table in (addresses, registers, bits, info)
+    for ann, labels in table.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def badaddr_annot(addr, radix):
+    """Compose annotation data of an unknown slave address.
+
+    - The set of possible addresses is small, so that the data are composed
+      just once for each address and number format.
+    """
+    ann = AnnInfo.BADADD
+    val = hlp.format_data(addr, radix)
+    return [ann, compose_annot(info[ann], ann_value=val)]
+
+
+###############################################################################
+# Register helpers
+###############################################################################
+def decode_config(dataword):
+    """Extract all fields of the configuration register at once.
+
+    Arguments
+    ---------
+    dataword : int
+        Content of the configuration register.
+
+    Returns
+    -------
+    list of int
+        Raw values of the fields in order of the table ``config_fields``.
+
+    """
+    return [dataword >> lsb & mask for lsb, mask in config_masks]
+
 
 ###############################################################################
 # Decoder
@@ -258,7 +423,20 @@ class Decoder(srd.Decoder):
     )
 
     def __init__(self):
-        """Initialize decoder."""
+        """Initialize decoder and its invariant dispatch tables."""
+        self.state_handlers = (  # Convert state to its handler
+            self.state_idle,                # State.IDLE
+            self.state_address_slave,       # State.ADDRESS_SLAVE
+            self.state_register_address,    # State.REGISTER_ADDRESS
+            self.state_register_data,       # State.REGISTER_DATA
+        )
+        self.data_handlers = {  # Convert register to its data handler
+            GeneralCall.RESET: self.handle_datareg_0x06,
+            Register.TEMP: self.handle_datareg_0x00,
+            Register.CONF: self.handle_datareg_0x01,
+            Register.TLOW: self.handle_datareg_0x02,
+            Register.THIGH: self.handle_datareg_0x03,
+        }
         self.reset()
 
     def reset(self):
@@ -268,7 +446,7 @@ class Decoder(srd.Decoder):
         self.es = 0         # End sample
         self.ssb = 0        # Start sample of an annotation transmission block
         self.write = True   # Flag about recent write action (default write)
-        self.state = "IDLE"
+        self.state = State.IDLE
         # Specific parameters for a device
         self.addr = Address.GND     # Slave address (default ADD0 grounded)
         self.reg = Register.TEMP    # Processed slave register (default temp)
@@ -284,52 +462,19 @@ class Decoder(srd.Decoder):
     def start(self):
         """Actions before the beginning of the decoding."""
         self.out_ann = self.register(srd.OUTPUT_ANN)
-
-    def putd(self, sb, eb, data):
-        """Span data output across bit range.
-
-        - Because bits are order with MSB first, the output is an annotation
-          block from the last sample of the start bit (sb) to the first sample
-          of the end bit (eb).
-        - The higher bit the lower sample number.
-        """
-        self.put(self.bits[eb][1], self.bits[sb][2], self.out_ann, data)
-
-    def putb(self, sb, eb=None, ann=AnnBits.RESERVED):
-        """Span special bit annotation across bit range bit by bit.
-
-        Arguments
-        ---------
-        sb : integer
-            Number of the annotated start bit counting from 0.
-        eb : integer
-            Number of the end bit right after the last annotated bit
-            counting from 0. If none value is provided, the method uses
-            start value increased by 1, so that just the first bit will be
-            annotated.
-        ann : integer
-            Index of the special bit's annotation in the annotations list
-            `bits`. Default value is for reserved bit.
-
-        """
-        annots = hlp.compose_annot(bits[ann])
-        for bit in range(sb, eb or (sb + 1)):
-            self.put(self.bits[bit][1], self.bits[bit][2],
-                     self.out_ann, [ann, annots])
+        # Number format of register values
+        self.radix = self.options["radix"]
+        # Conversion and measurement unit of temperatures
+        self.convert_temp = temp_scales[self.options["units"]]
+        self.unit = " " + temp_units[self.options["units"]]
 
     def check_addr(self, addr_slave, check_gencall=False):
         """Check correct slave address or general call."""
-        if addr_slave in (
-            Address.GND,
-            Address.VCC,
-            Address.SDA,
-            Address.SCL,
-        ) or not check_gencall or addr_slave == GeneralCall.ADDRESS:
+        if addr_slave in slave_addrs or not check_gencall \
+                or addr_slave == GeneralCall.ADDRESS:
             return True
-        ann = AnnInfo.BADADD
-        val = hlp.format_data(self.addr, self.options["radix"])
-        annots = hlp.compose_annot(info[ann], ann_value=val)
-        self.put(self.ss, self.es, self.out_ann, [ann, annots])
+        self.put(self.ss, self.es, self.out_ann,
+                 badaddr_annot(addr_slave, self.radix))
         return False
 
     def calculate_temperature(self, rawdata):
@@ -347,78 +492,60 @@ class Decoder(srd.Decoder):
             option.
 
         """
-        if rawdata & (1 << TempBits.EM):
+        if rawdata & em_mask:
             self.em = True
-        # Extended mode (13-bit resolution)
-        if self.em:
-            rawdata >>= 3
-            if rawdata > 0x0fff:
-                rawdata |= 0xe000  # 2s complement
-        # Normal mode (12-bit resolution)
-        else:
-            rawdata >>= 4
-            if rawdata > 0x07ff:
-                rawdata |= 0xf000  # 2s complement
-        temperature = rawdata / 16  # Celsius
-        if self.options["units"] == "Fahrenheit":
-            temperature *= 9 / 5
-            temperature += 32
-        elif self.options["units"] == "Kelvin":
-            temperature += 273.15
-        # Measurement unit
-        unit = " {}".format(temp_units[self.options["units"]])
-        return temperature, unit
+        shift, sign = temp_modes[self.em]
+        rawdata = ((rawdata >> shift) ^ sign) - sign  # 2s complement
+        return self.convert_temp(rawdata), self.unit
 
     def collect_data(self, databyte):
-        """Collect data byte to a data cache."""
-        if self.bytes:
-            self.bytes.insert(0, databyte)
-        else:
+        """Collect data byte to a data cache.
+
+        - Bytes are stored in order of their transmission, i.e., the most
+          significant byte of a data word first.
+        """
+        if not self.bytes:
             self.ssd = self.ss
-            self.bytes.append(databyte)
+        self.bytes.append(databyte)
 
     def format_rw(self):
         """Format read/write action."""
-        act = (AnnInfo.READ, AnnInfo.WRITE)[self.write]
-        return info[act]
+        return rw_actions[self.write]
 
     def handle_addr(self):
         """Process slave address."""
         if not self.bytes:
             return
         # Registers row
-        self.addr = self.bytes[0]
+        self.addr = self.bytes[-1]
         ann = addr_annots[self.addr]
-        annots = hlp.compose_annot(addresses[ann])
-        self.put(self.ss, self.es, self.out_ann, [ann, annots])
+        self.put(self.ss, self.es, self.out_ann, static_data[ann])
         self.clear_data()
 
     def handle_reg(self):
         """Process slave register."""
         if not self.bytes:
             return
-        self.reg = self.bytes[0]
+        self.reg = self.bytes[-1]
         if self.addr == GeneralCall.ADDRESS:
-            ann = reg_annots_gc[self.reg]
-            act = None
+            data = static_data[reg_annots_gc[self.reg]]
         else:
             ann = reg_annots[self.reg]
-            act = info[AnnInfo.SELECT]
-        annots = hlp.compose_annot(registers[ann], ann_action=act)
-        self.put(self.ss, self.es, self.out_ann, [ann, annots])
+            annots = compose_annot(registers[ann],
+                                   ann_action=info[AnnInfo.SELECT])
+            data = [ann, annots]
+        self.put(self.ss, self.es, self.out_ann, data)
         self.clear_data()
 
     def handle_nodata(self):
         """Process transmission without any data."""
         # Info row
-        ann = AnnInfo.CHECK
-        annots = hlp.compose_annot(info[ann])
-        self.put(self.ssb, self.es, self.out_ann, [ann, annots])
+        self.put(self.ssb, self.es, self.out_ann, static_data[AnnInfo.CHECK])
 
     def handle_data(self):
-        """Create name and call corresponding data register handler."""
-        fn = getattr(self, "handle_datareg_{:#04x}".format(self.reg))
-        dataword = ((self.bytes[1] << 8) + self.bytes[0]) if (self.bytes) \
+        """Call the data register handler from the dispatch table."""
+        fn = self.data_handlers[self.reg]
+        dataword = ((self.bytes[-2] << 8) + self.bytes[-1]) if (self.bytes) \
             else None
         fn(dataword)
         self.clear_data()
@@ -426,152 +553,163 @@ class Decoder(srd.Decoder):
     def handle_datareg_0x06(self, dataword):
         """Process general reset register."""
         # Info row
-        ann = AnnInfo.GRST
-        annots = hlp.compose_annot(info[ann])
-        self.put(self.ssb, self.es, self.out_ann, [ann, annots])
+        self.put(self.ssb, self.es, self.out_ann, static_data[AnnInfo.GRST])
 
     def handle_datareg_0x01(self, dataword):
         """Process configuration register."""
-        # Bits row - OS bit - one-shot measurement
-        os = dataword >> ConfigBits.OS & 1
-        os_l = ("dis", "en")[os] + "abled"
-        os_s = os_l[0].upper()
-        ann = AnnBits.OS
-        annots = hlp.compose_annot(bits[ann], [os, os_l, os_s])
-        self.putd(ConfigBits.OS, ConfigBits.OS, [ann, annots])
-        # Bits row - R0/R1 bits - converter resolution
-        res = resolutions[dataword >> ConfigBits.R0 & 0b11]
-        ann = AnnBits.R0
-        val = "{}".format(res)
-        annots = hlp.compose_annot(bits[ann], ann_value=val, ann_unit="bit")
-        self.putd(ConfigBits.R0, ConfigBits.R1, [ann, annots])
-        # Bits row - F0/F1 bits - fault queue
-        flt = faults[dataword >> ConfigBits.F0 & 0b11]
-        ann = AnnBits.F0
-        val = "{}".format(flt)
-        annots = hlp.compose_annot(bits[ann], ann_value=val)
-        self.putd(ConfigBits.F0, ConfigBits.F1, [ann, annots])
-        # Bits row - POL bit - polarity, alert active
-        pol = dataword >> ConfigBits.POL & 1
-        pol_l = ("low", "high")[pol]
-        pol_s = pol_l[0].upper()
-        ann = AnnBits.POL
-        annots = hlp.compose_annot(bits[ann], ann_value=[pol, pol_l, pol_s])
-        self.putd(ConfigBits.POL, ConfigBits.POL, [ann, annots])
-        # Bits row - TM bit - thermostat mode
-        tm = dataword >> ConfigBits.TM & 1
-        tm_l = ("comparator", "interrupt")[tm]
-        tm_s = tm_l[0].upper()
-        ann = AnnBits.TM
-        annots = hlp.compose_annot(bits[ann], ann_value=[tm, tm_l, tm_s])
-        self.putd(ConfigBits.TM, ConfigBits.TM, [ann, annots])
-        # Bits row - SD bit - shutdown mode
-        sd = dataword >> ConfigBits.SD & 1
-        sd_l = ("dis", "en")[sd] + "abled"
-        sd_s = sd_l[0].upper()
-        ann = AnnBits.SD
-        annots = hlp.compose_annot(bits[ann], ann_value=[sd, sd_l, sd_s])
-        self.putd(ConfigBits.SD, ConfigBits.SD, [ann, annots])
-        # Bits row - CR0/CR1 bits - conversion rate
-        rate = rates[dataword >> ConfigBits.CR0 & 0b11]
-        ann = AnnBits.CR0
-        annots = hlp.compose_annot(bits[ann], ann_value=rate, ann_unit="Hz")
-        self.putd(ConfigBits.CR0, ConfigBits.CR1, [ann, annots])
-        # Bits row - AL bit - alert
-        al = dataword >> ConfigBits.AL & 1
-        al_l = ("", "in")[al ^ pol] + "active"
-        al_s = al_l[0].upper()
+        fields = decode_config(dataword)
+        put, out_ann, bitlist = self.put, self.out_ann, self.bits
+        # Bits row - fields with values from lookup tables
+        for (ann, lsb, msb, labels, unit), value in zip(config_fields, fields):
+            if labels is None:
+                continue  # Annotated separately below
+            annots = compose_annot(bits[ann], ann_value=labels[value],
+                                   ann_unit=unit)
+            put(bitlist[msb][1], bitlist[lsb][2], out_ann, [ann, annots])
+        # Bits row - AL bit - alert, with active level given by polarity
+        pol = fields[config_index[AnnBits.POL]]
+        al = fields[config_index[AnnBits.AL]]
         ann = AnnBits.AL
-        annots = hlp.compose_annot(bits[ann], ann_value=[al, al_l, al_s])
-        self.putd(ConfigBits.AL, ConfigBits.AL, [ann, annots])
+        annots = compose_annot(bits[ann], ann_value=alerts[al][pol])
+        _, ss, es = bitlist[ConfigBits.AL]
+        put(ss, es, out_ann, [ann, annots])
         # Bits row - EM bit - extended mode
-        em = dataword >> ConfigBits.EM & 1
+        em = fields[config_index[AnnBits.EM]]
         self.em = bool(em)
-        em_l = ("dis", "en")[em] + "abled"
-        em_s = em_l[0].upper()
         ann = AnnBits.EM
-        annots = hlp.compose_annot(bits[ann], ann_value=[em, em_l, em_s])
-        self.putd(ConfigBits.EM, ConfigBits.EM, [ann, annots])
-        # Bits row - reserved bits
-        for i in range(ConfigBits.EM - 1, -1, -1):
-            self.putb(i)
+        annots = compose_annot(bits[ann], ann_value=enables[em])
+        _, ss, es = bitlist[ConfigBits.EM]
+        put(ss, es, out_ann, [ann, annots])
+        # Bits row - reserved bits as one span
+        put(bitlist[ConfigBits.EM - 1][1], bitlist[0][2], out_ann,
+            static_data[AnnBits.RESERVED])
         # Registers row
         ann = AnnRegs.CONF
-        val = hlp.format_data(dataword, self.options["radix"])
-        annots = hlp.compose_annot(registers[ann], ann_value=val)
-        self.put(self.ssd, self.es, self.out_ann, [ann, annots])
+        val = format_data(dataword, self.radix)
+        annots = compose_annot(registers[ann], ann_value=val)
+        put(self.ssd, self.es, out_ann, [ann, annots])
         # Info row
         ann = AnnInfo.CONF
-        val = info[prm_annots[
-                (Params.CUSTOM, dataword)[dataword == Params.POWERUP]]]
+        val = info[prm_annots[dataword == Params.POWERUP]]
         act = self.format_rw()
-        annots = hlp.compose_annot(info[ann], ann_value=val, ann_action=act)
-        self.put(self.ssb, self.es, self.out_ann, [ann, annots])
+        annots = compose_annot(info[ann], ann_value=val, ann_action=act)
+        put(self.ssb, self.es, out_ann, [ann, annots])
 
     def handle_datareg_0x00(self, dataword):
         """Process temperature register."""
         temp, unit = self.calculate_temperature(dataword)
+        put, out_ann, bitlist = self.put, self.out_ann, self.bits
         # Bits row - EM bit - extended mode
-        em = int(self.em)
-        em_l = ("dis", "en")[self.em] + "abled"
-        em_s = em_l[0].upper()
         ann = AnnBits.EM
-        annots = hlp.compose_annot(bits[ann], [em, em_l, em_s])
-        self.putd(TempBits.EM, TempBits.EM, [ann, annots])
-        # Bits row - reserved bits
+        annots = compose_annot(bits[ann], ann_value=enables[self.em])
+        _, ss, es = bitlist[TempBits.EM]
+        put(ss, es, out_ann, [ann, annots])
+        # Bits row - reserved bits as one span
         res_bits = (3, 2)[self.em]
         bit_min = TempBits.RESERVED
         bit_max = bit_min + res_bits
-        self.putb(bit_min, bit_max)
+        put(bitlist[bit_max - 1][1], bitlist[bit_min][2], out_ann,
+            static_data[AnnBits.RESERVED])
         # Bits row - data bits
         data_bits = 8 * len(self.bytes) - 1 - res_bits
-        bit_min = bit_max
-        bit_max = bit_min + data_bits
-        self.putb(bit_min, bit_max, AnnBits.DATA)
+        data = static_data[AnnBits.DATA]
+        for _, ss, es in bitlist[bit_max:bit_max + data_bits]:
+            put(ss, es, out_ann, data)
         # Registers row
         ann = AnnRegs.TEMP
-        val = hlp.format_data(dataword, self.options["radix"])
-        annots = hlp.compose_annot(registers[ann], ann_value=val)
-        self.put(self.ssd, self.es, self.out_ann, [ann, annots])
+        annots = tempreg_annot(dataword, self.radix)
+        put(self.ssd, self.es, out_ann, [ann, annots])
         # Info row
         ann = AnnInfo.TEMP
-        annots = hlp.compose_annot(info[ann], ann_value=temp, ann_unit=unit)
-        self.put(self.ssb, self.es, self.out_ann, [ann, annots])
+        annots = temp_annot(temp, unit)
+        put(self.ssb, self.es, out_ann, [ann, annots])
 
     def handle_datareg_0x02(self, dataword):
         """Process TLOW register."""
-        temp, unit = self.calculate_temperature(dataword)
-        # Registers row
-        ann = AnnRegs.TLOW
-        val = hlp.format_data(dataword, self.options["radix"])
-        annots = hlp.compose_annot(registers[ann], ann_value=val)
-        self.put(self.ssd, self.es, self.out_ann, [ann, annots])
-        # Info row
-        ann = AnnInfo.TLOW
-        act = self.format_rw()
-        annots = hlp.compose_annot(info[ann], ann_value=temp, ann_unit=unit,
-                                   ann_action=act)
-        self.put(self.ssb, self.es, self.out_ann, [ann, annots])
+        self.handle_limit(dataword, AnnRegs.TLOW, AnnInfo.TLOW)
 
     def handle_datareg_0x03(self, dataword):
         """Process THIGH register."""
+        self.handle_limit(dataword, AnnRegs.THIGH, AnnInfo.THIGH)
+
+    def handle_limit(self, dataword, ann_reg, ann_info):
+        """Process temperature limit register.
+
+        Arguments
+        ---------
+        dataword : int
+            Content of the TLOW or THIGH register.
+        ann_reg : int
+            Annotation index of the register in the registers row.
+        ann_info : int
+            Annotation index of the limit in the info row.
+
+        """
         temp, unit = self.calculate_temperature(dataword)
         # Registers row
-        ann = AnnRegs.THIGH
-        val = hlp.format_data(dataword, self.options["radix"])
-        annots = hlp.compose_annot(registers[ann], ann_value=val)
-        self.put(self.ssd, self.es, self.out_ann, [ann, annots])
+        val = format_data(dataword, self.radix)
+        annots = compose_annot(registers[ann_reg], ann_value=val)
+        self.put(self.ssd, self.es, self.out_ann, [ann_reg, annots])
         # Info row
-        ann = AnnInfo.THIGH
         act = self.format_rw()
-        annots = hlp.compose_annot(info[ann], ann_value=temp, ann_unit=unit,
-                                   ann_action=act)
-        self.put(self.ssb, self.es, self.out_ann, [ann, annots])
+        annots = compose_annot(info[ann_info], ann_value=temp, ann_unit=unit,
+                               ann_action=act)
+        self.put(self.ssb, self.es, self.out_ann, [ann_info, annots])
+
+    def state_idle(self, cmd, databyte):
+        """Wait for an I2C transmission."""
+        if cmd != "START":
+            return
+        self.ssb = self.ss
+        self.state = State.ADDRESS_SLAVE
+
+    def state_address_slave(self, cmd, databyte):
+        """Wait for a slave address."""
+        if cmd in addr_cmds:
+            if self.check_addr(databyte, check_gencall=True):
+                self.collect_data(databyte)
+                self.handle_addr()
+                if cmd == "ADDRESS READ":
+                    self.write = False
+                    self.state = State.REGISTER_DATA
+                else:
+                    self.write = True
+                    self.state = State.REGISTER_ADDRESS
+            else:
+                self.state = State.IDLE
+
+    def state_register_address(self, cmd, databyte):
+        """Process slave register."""
+        if cmd in data_cmds:
+            self.collect_data(databyte)
+            self.handle_reg()
+            self.state = State.REGISTER_DATA
+        elif cmd in end_cmds:
+            """Output end of transmission without any register and data."""
+            self.handle_nodata()
+            self.state = State.IDLE
+
+    def state_register_data(self, cmd, databyte):
+        """Process data of a slave register.
+
+        - Individual command or data can end either with repeated start
+          condition or with stop condition.
+        """
+        if cmd in data_cmds:
+            self.collect_data(databyte)
+        elif cmd == "START REPEAT":
+            self.state = State.ADDRESS_SLAVE
+        elif cmd == "STOP":
+            """Output formatted string with register data.
+            - This is end of an I2C transmission. Start waiting for another
+              one.
+            """
+            self.handle_data()
+            self.state = State.IDLE
 
     def decode(self, ss, es, data):
         """Decode samples provided by parent decoder."""
         cmd, databyte = data
-        self.ss, self.es = ss, es
 
         if cmd == "BITS":
             """Collect packet of bits that belongs to the following command.
@@ -584,57 +722,12 @@ class Decoder(srd.Decoder):
               the least significant bit (LSB) to the most significant bit
               (MSB) as it is at representing numbers in computers, although I2C
               bus transmits data in oposite order with MSB first.
+            - Hence an annotation of a bit span runs from the start sample of
+              its highest bit to the end sample of its lowest bit.
             """
-            self.bits = databyte + self.bits
+            self.bits[0:0] = databyte  # Prepend in place
             return
 
         # State machine
-        if self.state == "IDLE":
-            """Wait for an I2C transmission."""
-            if cmd != "START":
-                return
-            self.ssb = self.ss
-            self.state = "ADDRESS SLAVE"
-
-        elif self.state == "ADDRESS SLAVE":
-            """Wait for a slave address."""
-            if cmd in ["ADDRESS WRITE", "ADDRESS READ"]:
-                if self.check_addr(databyte, check_gencall=True):
-                    self.collect_data(databyte)
-                    self.handle_addr()
-                    if cmd == "ADDRESS READ":
-                        self.write = False
-                        self.state = "REGISTER DATA"
-                    elif cmd == "ADDRESS WRITE":
-                        self.write = True
-                        self.state = "REGISTER ADDRESS"
-                else:
-                    self.state = "IDLE"
-
-        elif self.state == "REGISTER ADDRESS":
-            """Process slave register"""
-            if cmd in ["DATA WRITE", "DATA READ"]:
-                self.collect_data(databyte)
-                self.handle_reg()
-                self.state = "REGISTER DATA"
-            elif cmd in ["STOP", "START REPEAT"]:
-                """Output end of transmission without any register and data."""
-                self.handle_nodata()
-                self.state = "IDLE"
-
-        elif self.state == "REGISTER DATA":
-            """Process data of a slave register.
-            - Individual command or data can end either with repeated start
-              condition or with stop condition.
-            """
-            if cmd in ["DATA WRITE", "DATA READ"]:
-                self.collect_data(databyte)
-            elif cmd == "START REPEAT":
-                self.state = "ADDRESS SLAVE"
-            elif cmd == "STOP":
-                """Output formatted string with register data.
-                - This is end of an I2C transmission. Start waiting for another
-                  one.
-                """
-                self.handle_data()
-                self.state = "IDLE"
+        self.ss, self.es = ss, es
+        self.state_handlers[self.state](cmd, databyte)